@@ -145,6 +145,18 @@ def optimize():
         traceback.print_exc()
         return jsonify({"status": "error", "message": str(e)}), 500
 
+@app.route('/api/preview_coefficients', methods=['GET'])
+def preview_coefficients():
+    """スライダー連動プレビュー用の候補係数（属性行列・関連度・文字数）を返す"""
+    global DATA_STORE
+    try:
+        coefficients = LogicHandler.build_preview_coefficients(DATA_STORE['candidates'])
+        return jsonify({"status": "success", "coefficients": coefficients})
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({"status": "error", "message": str(e)}), 500
+
 # --- BBO Endpoints ---
 
 @app.route('/api/bbo_step', methods=['POST'])
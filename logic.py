@@ -60,6 +60,25 @@ class DraftItem:
         )
 
 class LogicHandler:
+
+    # run_optimization の係数（ブラウザ側プレビューとも共有する）
+    RELEVANCE_WEIGHT = 2.0
+    LENGTH_PENALTY = 0.001
+
+    # パラメータキーと候補属性キーの対応（プレビュー用属性行列の列順）
+    PARAM_ATTRIBUTE_KEYS = [
+        ("p_desc_style", "desc_style", "Scene Craft"),
+        ("p_perspective", "perspective", "Scene Craft"),
+        ("p_sensory", "sensory", "Scene Craft"),
+        ("p_thought", "thought", "Scene Craft"),
+        ("p_tension", "tension", "Scene Craft"),
+        ("p_reality", "reality", "Scene Craft"),
+        ("p_char_count", "char_count", "Character Dynamics"),
+        ("p_char_mental", "char_mental", "Character Dynamics"),
+        ("p_char_belief", "char_belief", "Character Dynamics"),
+        ("p_char_trauma", "char_trauma", "Character Dynamics"),
+        ("p_char_voice", "char_voice", "Character Dynamics"),
+    ]
     
     @staticmethod
     def generate_candidates_api(api_key, topic_main, topic_sub1, topic_sub2, params):
@@ -211,14 +230,14 @@ class LogicHandler:
                     cost_i += (val - target_val) ** 2
             
             # 関連度も考慮 (関連度が高い=1.0に近いほどエネルギーを下げる)
-            cost_i -= 2.0 * c.relevance
+            cost_i -= LogicHandler.RELEVANCE_WEIGHT * c.relevance
             
             h_param_diff += cost_i * q[i]
 
         # 2. 文字数制約
         # 1ブロックあたりの文字数は text length から取得
         current_len = sum([len(c.text) * q[i] for i, c in enumerate(candidates)])
-        h_len_penalty = 0.001 * (current_len - float(params['length']))**2
+        h_len_penalty = LogicHandler.LENGTH_PENALTY * (current_len - float(params['length']))**2
 
         model = h_param_diff + h_len_penalty
 
@@ -236,6 +255,37 @@ class LogicHandler:
             
         return [c.to_dict() for c in candidates]
 
+    @staticmethod
+    def build_preview_coefficients(candidates_dict):
+        """
+        ブラウザ側のプレビュー選択用に、run_optimization の目的関数の係数を返す。
+        スライダー操作のたびにサーバーで求解せず、main.js が同じ目的関数を厳密に解けるようにする。
+        attributes / mask の列順は param_keys に従う（mask=1 の列のみコストに加算）。
+        """
+        candidates = [DraftItem.from_dict(d) for d in candidates_dict]
+
+        attributes = []
+        mask = []
+        for c in candidates:
+            row = []
+            row_mask = []
+            for _, attr_key, attr_type in LogicHandler.PARAM_ATTRIBUTE_KEYS:
+                row.append(float(c.attributes.get(attr_key, 0.5)))
+                row_mask.append(1 if c.type == attr_type else 0)
+            attributes.append(row)
+            mask.append(row_mask)
+
+        return {
+            "ids": [c.id for c in candidates],
+            "param_keys": [k for k, _, _ in LogicHandler.PARAM_ATTRIBUTE_KEYS],
+            "attributes": attributes,
+            "mask": mask,
+            "relevance": [c.relevance for c in candidates],
+            "lengths": [len(c.text) for c in candidates],
+            "relevance_weight": LogicHandler.RELEVANCE_WEIGHT,
+            "length_penalty": LogicHandler.LENGTH_PENALTY
+        }
+
     @staticmethod
     def run_bbo_optimization(token, candidates_dict, history, params):
         """
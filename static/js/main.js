@@ -49,6 +49,8 @@ function getCommonData() {
 function renderCandidates(candidates) {
     const container = document.getElementById('candidatesContainer');
     container.innerHTML = '';
+    // サーバー側の確定結果を表示するので、プレビュー表示は解除する
+    clearPreview();
 
     if (!candidates || candidates.length === 0) {
         container.innerHTML = '<div class="alert alert-light text-center p-5">候補はまだありません。Tab 1で生成してください。</div>';
@@ -74,6 +76,7 @@ function renderCandidates(candidates) {
             // item.selected (Amplify推奨) ならハイライト
             const optimizedClass = item.selected ? 'optimized-selected' : '';
             card.className = `card card-candidate p-3 ${optimizedClass}`;
+            card.dataset.id = item.id;
             
             // 評価ラジオボタンの生成
             let ratingHtml = '';
@@ -162,6 +165,7 @@ async function generateCandidates() {
         const result = await res.json();
         if (result.status === 'success') {
             renderCandidates(result.candidates);
+            loadPreviewCoefficients();
             document.getElementById('bboHistoryCount').innerText = "学習データ数: 0";
             const tab2 = new bootstrap.Tab(document.getElementById('tab2-tab'));
             tab2.show();
@@ -199,6 +203,110 @@ async function runOptimizationLegacy() {
     }
 }
 
+// --- スライダー連動プレビュー ---
+// run_optimization と同じ目的関数をブラウザ側で厳密に解き、選択結果を即時表示する。
+// 確定（選択の保存）は従来どおり /api/optimize のサーバーソルバーで行う。
+
+const PARAM_SLIDER_IDS = [
+    'pDescStyle', 'pPerspective', 'pSensory', 'pThought', 'pTension', 'pReality',
+    'pCharCount', 'pCharMental', 'pCharBelief', 'pCharTrauma', 'pCharVoice', 'pLength'
+];
+
+let previewCoefficients = null;
+
+async function loadPreviewCoefficients() {
+    try {
+        const res = await fetch('/api/preview_coefficients');
+        const result = await res.json();
+        if (result.status === 'success') {
+            previewCoefficients = result.coefficients;
+        }
+    } catch (e) {
+        console.error(e);
+    }
+}
+
+// 線形コスト + 文字数ペナルティ(二次)の最小化を、合計文字数についての 0-1 ナップサックDPで厳密に解く
+function solvePreview(coef, params) {
+    const n = coef.ids.length;
+    const cost = coef.ids.map((_, i) => {
+        let c = 0;
+        coef.param_keys.forEach((key, k) => {
+            if (coef.mask[i][k]) c += (coef.attributes[i][k] - params[key]) ** 2;
+        });
+        return c - coef.relevance_weight * coef.relevance[i];
+    });
+
+    // best[t]: 合計文字数がちょうど t となる選択の最小線形コスト
+    const maxLen = coef.lengths.reduce((a, b) => a + b, 0);
+    const width = maxLen + 1;
+    let best = new Float64Array(width).fill(Infinity);
+    best[0] = 0;
+    const take = new Uint8Array(n * width);
+    for (let i = 0; i < n; i++) {
+        const len = coef.lengths[i];
+        const next = best.slice();
+        for (let t = len; t <= maxLen; t++) {
+            const v = best[t - len] + cost[i];
+            if (v < next[t]) {
+                next[t] = v;
+                take[i * width + t] = 1;
+            }
+        }
+        best = next;
+    }
+
+    let bestT = 0;
+    let bestEnergy = Infinity;
+    for (let t = 0; t <= maxLen; t++) {
+        if (best[t] === Infinity) continue;
+        const energy = best[t] + coef.length_penalty * (t - params.length) ** 2;
+        if (energy < bestEnergy) {
+            bestEnergy = energy;
+            bestT = t;
+        }
+    }
+
+    // 復元
+    const selected = new Set();
+    let t = bestT;
+    for (let i = n - 1; i >= 0; i--) {
+        if (take[i * width + t]) {
+            selected.add(coef.ids[i]);
+            t -= coef.lengths[i];
+        }
+    }
+    return {selected: selected, totalLength: bestT};
+}
+
+function updatePreview() {
+    if (!previewCoefficients || previewCoefficients.ids.length === 0) return;
+
+    const result = solvePreview(previewCoefficients, getParams());
+    const container = document.getElementById('candidatesContainer');
+    container.classList.add('preview-mode');
+    container.querySelectorAll('.card-candidate').forEach(card => {
+        card.classList.toggle('preview-selected', result.selected.has(Number(card.dataset.id)));
+    });
+
+    const status = document.getElementById('previewStatus');
+    status.innerText = `プレビュー: ${result.selected.size}ブロック / ${result.totalLength}字 (未確定)`;
+    status.classList.remove('d-none');
+}
+
+function clearPreview() {
+    document.getElementById('candidatesContainer').classList.remove('preview-mode');
+    const status = document.getElementById('previewStatus');
+    if (status) status.classList.add('d-none');
+}
+
+function initPreview() {
+    loadPreviewCoefficients();
+    PARAM_SLIDER_IDS.forEach(id => {
+        document.getElementById(id).addEventListener('input', updatePreview);
+    });
+}
+
 // --- BBO / Human-in-the-Loop 関連 ---
 
 async function runBBOIteration() {